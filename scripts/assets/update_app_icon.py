@@ -1,27 +1,58 @@
 from PIL import Image
-import os
+import hashlib
+import shutil
+from pathlib import Path
 
-logo_path = "/Users/luwenting/development/ChillNote/chillnote/Assets.xcassets/logo.imageset/logo.png"
-app_icon_path = "/Users/luwenting/development/ChillNote/chillnote/Assets.xcassets/AppIcon.appiconset/AppIcon.png"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ASSETS_DIR = REPO_ROOT / "chillnote" / "Assets.xcassets"
+
+logo_path = ASSETS_DIR / "logo.imageset" / "logo.png"
+app_icon_path = ASSETS_DIR / "AppIcon.appiconset" / "AppIcon.png"
+
+# Older Pillow-SIMD builds only expose the filters at module level
+Resampling = getattr(Image, "Resampling", Image)
+LANCZOS = Resampling.LANCZOS
+BOX = Resampling.BOX
+
+def file_digest(path):
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
 
 def update_icon():
-    if not os.path.exists(logo_path):
+    if not logo_path.exists():
         print(f"Error: logo.png not found at {logo_path}")
         return
 
+    # Sidecar records "<logo digest> <AppIcon digest>" from the last successful run
+    hash_path = app_icon_path.parent / ".appicon.hash"
+    source_hash = file_digest(logo_path)
+    if app_icon_path.exists() and hash_path.exists():
+        if hash_path.read_text().split() == [source_hash, file_digest(app_icon_path)]:
+            print(f"AppIcon already up to date with {logo_path}, skipping")
+            return
+
     try:
         img = Image.open(logo_path)
         print(f"Original size: {img.size}")
 
-        # Resize to 1024x1024 if needed
-        if img.size != (1024, 1024):
-            print("Resizing to 1024x1024...")
-            img = img.resize((1024, 1024), Image.Resampling.LANCZOS)
-        
         # Ensure directory exists
-        os.makedirs(os.path.dirname(app_icon_path), exist_ok=True)
-        
-        img.save(app_icon_path, "PNG")
+        app_icon_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if img.size == (1024, 1024) and img.format == "PNG":
+            # Already a 1024x1024 PNG, copy it as-is instead of re-encoding
+            shutil.copyfile(logo_path, app_icon_path)
+        else:
+            # Resize to 1024x1024 if needed
+            if img.size != (1024, 1024):
+                print("Resizing to 1024x1024...")
+                # Cheap box pre-downsample so Lanczos only sees ~2x the target pixels;
+                # cap each axis separately since the final resize stretches to a square
+                if img.width > 2048 or img.height > 2048:
+                    img = img.resize((min(img.width, 2048), min(img.height, 2048)), BOX)
+                img = img.resize((1024, 1024), LANCZOS)
+
+            img.save(app_icon_path, "PNG")
+
+        hash_path.write_text(f"{source_hash} {file_digest(app_icon_path)}\n")
         print(f"Successfully set {logo_path} as AppIcon at {app_icon_path}")
     except Exception as e:
         print(f"Failed to update icon: {e}")
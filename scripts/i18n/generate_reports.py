@@ -2,82 +2,86 @@
 import csv
 import json
 import re
+from itertools import chain
 from pathlib import Path
 
+from swift_literals import collect_swift_literals, save_literal_cache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 CATALOG_PATH = Path('chillnote/Resources/Localizable.xcstrings')
 OUTPUT_DIR = Path('docs/i18n')
-SWIFT_ROOT = Path('chillnote')
 
-UI_LITERAL_PATTERN = re.compile(
-    r'\b(Text|Button|Label|TextField)\(\s*"((?:\\.|[^"\\])*)"|'
-    r'\.alert\(\s*"((?:\\.|[^"\\])*)"|'
-    r'\.navigationTitle\(\s*"((?:\\.|[^"\\])*)"|'
-    r'\.accessibility(?:Label|Hint)\(\s*"((?:\\.|[^"\\])*)"'
-)
+# Interpolation or format specifiers; one scan instead of three `in` checks
+HIGH_RISK_PATTERN = re.compile(r'\\\(|%@|%lld')
 
 
 def load_catalog():
-    data = json.loads(CATALOG_PATH.read_text(encoding='utf-8'))
+    if orjson is not None:
+        data = orjson.loads(CATALOG_PATH.read_bytes())
+    else:
+        data = json.loads(CATALOG_PATH.read_text(encoding='utf-8'))
     return data.get('strings', {})
 
 
-def iter_swift_literals():
-    for path in SWIFT_ROOT.rglob('*.swift'):
-        content = path.read_text(encoding='utf-8')
-        for match in UI_LITERAL_PATTERN.finditer(content):
-            literal = next((group for group in match.groups()[1:] if group), None)
-            if not literal:
-                continue
-            literal = literal.replace('\\n', '\n')
-            literal = literal.replace('\\"', '"')
-            line = content.count('\n', 0, match.start()) + 1
-            dynamic = '\\(' in literal
+def iter_swift_literals(files: dict):
+    for path, entry in files.items():
+        for literal, line, context in entry['literals']:
             yield {
                 'key': literal,
-                'file': str(path),
+                'file': path,
                 'line': line,
-                'is_dynamic': dynamic,
-                'context': match.group(1) or 'modifier',
+                'is_dynamic': '\\(' in literal,
+                'context': context,
             }
 
 
 def risk_level(literal: str) -> str:
-    if '\\(' in literal or '%@' in literal or '%lld' in literal:
+    if HIGH_RISK_PATTERN.search(literal):
         return 'high'
     if len(literal) > 48:
         return 'medium'
     return 'low'
 
 
-def generate_inventory(strings: dict):
-    rows = list(iter_swift_literals())
+def generate_inventory(keys: frozenset, rows: list[dict]):
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     csv_path = OUTPUT_DIR / 'string_inventory_v1.csv'
 
+    # Many literals ("OK", "Cancel", ...) repeat across files; classify each once
+    risks = {key: risk_level(key) for key in {row['key'] for row in rows}}
+
     with csv_path.open('w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=['key', 'file', 'line', 'context', 'is_dynamic', 'in_catalog', 'risk'],
+        writer = csv.writer(f)
+        writer.writerow(['key', 'file', 'line', 'context', 'is_dynamic', 'in_catalog', 'risk'])
+        writer.writerows(
+            (
+                row['key'],
+                row['file'],
+                row['line'],
+                row['context'],
+                row['is_dynamic'],
+                row['key'] in keys,
+                risks[row['key']],
+            )
+            for row in rows
         )
-        writer.writeheader()
-        for row in rows:
-            row['in_catalog'] = row['key'] in strings
-            row['risk'] = risk_level(row['key'])
-            writer.writerow(row)
 
 
-def generate_missing_report(strings: dict):
-    literals = list(iter_swift_literals())
-    keys = set(strings.keys())
+def format_missing_row(row: dict) -> str:
+    key = row['key'].replace('|', '\\|')
+    dynamic = 'yes' if row['is_dynamic'] else 'no'
+    return f"| `{key}` | `{row['file']}` | {row['line']} | {dynamic} |"
 
-    missing = []
-    for row in literals:
-        if row['key'] in keys:
-            continue
-        missing.append(row)
+
+def generate_missing_report(keys: frozenset, literals: list[dict]):
+    missing = [row for row in literals if row['key'] not in keys]
 
     report_path = OUTPUT_DIR / 'missing_keys_report_v1.md'
-    lines = [
+    header = [
         '# Missing Localization Keys Report v1',
         '',
         f'- Total missing literals: {len(missing)}',
@@ -85,12 +89,8 @@ def generate_missing_report(strings: dict):
         '| Key | File | Line | Dynamic |',
         '| --- | --- | ---: | :---: |',
     ]
-    for row in missing[:400]:
-        lines.append(
-            f"| `{row['key'].replace('|', '\\|')}` | `{row['file']}` | {row['line']} | {'yes' if row['is_dynamic'] else 'no'} |"
-        )
-
-    report_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    rows = (format_missing_row(row) for row in missing[:400])
+    report_path.write_text('\n'.join(chain(header, rows)) + '\n', encoding='utf-8')
 
 
 def generate_glossary():
@@ -123,10 +123,14 @@ def generate_glossary():
 
 
 def main():
-    strings = load_catalog()
-    generate_inventory(strings)
-    generate_missing_report(strings)
+    keys = frozenset(load_catalog())
+    swift_files, cache_changed = collect_swift_literals()
+    literals = list(iter_swift_literals(swift_files))
+    generate_inventory(keys, literals)
+    generate_missing_report(keys, literals)
     generate_glossary()
+    if cache_changed:
+        save_literal_cache(swift_files)
     print('Generated docs/i18n/string_inventory_v1.csv')
     print('Generated docs/i18n/missing_keys_report_v1.md')
     print('Generated docs/i18n/glossary_v1.md')
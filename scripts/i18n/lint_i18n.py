@@ -1,24 +1,27 @@
 #!/usr/bin/env python3
 import json
-import re
 import sys
 from pathlib import Path
 
+from swift_literals import collect_swift_literals, save_literal_cache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 CATALOG_PATH = Path('chillnote/Resources/Localizable.xcstrings')
 REQUIRED_LOCALES = ['en', 'zh-Hans', 'zh-Hant', 'ja', 'fr', 'de', 'es', 'ko']
-SWIFT_ROOT = Path('chillnote')
 
-UI_LITERAL_PATTERN = re.compile(
-    r'\b(Text|Button|Label|TextField)\(\s*"((?:\\.|[^"\\])*)"|'
-    r'\.alert\(\s*"((?:\\.|[^"\\])*)"|'
-    r'\.navigationTitle\(\s*"((?:\\.|[^"\\])*)"|'
-    r'\.accessibility(?:Label|Hint)\(\s*"((?:\\.|[^"\\])*)"'
-)
+
+def load_catalog() -> dict:
+    if orjson is not None:
+        return orjson.loads(CATALOG_PATH.read_bytes())
+    return json.loads(CATALOG_PATH.read_text(encoding='utf-8'))
 
 
-def check_catalog() -> list[str]:
+def check_catalog(data: dict) -> list[str]:
     errors: list[str] = []
-    data = json.loads(CATALOG_PATH.read_text(encoding='utf-8'))
     strings = data.get('strings', {})
 
     for key, value in strings.items():
@@ -36,34 +39,36 @@ def check_catalog() -> list[str]:
     return errors
 
 
-def check_swift_literals() -> list[str]:
+def check_swift_literals(data: dict, swift_files: dict) -> list[str]:
     errors: list[str] = []
-    data = json.loads(CATALOG_PATH.read_text(encoding='utf-8'))
     keys = set((data.get('strings') or {}).keys())
 
-    for path in SWIFT_ROOT.rglob('*.swift'):
-        content = path.read_text(encoding='utf-8')
-        for match in UI_LITERAL_PATTERN.finditer(content):
-            literal = next((group for group in match.groups()[1:] if group), None)
-            if not literal:
-                continue
-            literal = literal.replace('\\n', '\n')
-            literal = literal.replace('\\"', '"')
-            if '\\(' in literal:
-                # interpolation should be handled via formatted keys
-                continue
-            if literal in keys:
-                continue
-            line = content.count('\n', 0, match.start()) + 1
-            errors.append(f'[swift] {path}:{line} literal not in catalog: "{literal}"')
+    # Group occurrences so each distinct literal is checked and reported once
+    locations: dict[str, list[str]] = {}
+    for path, entry in swift_files.items():
+        for literal, line, _context in entry['literals']:
+            locations.setdefault(literal, []).append(f'{path}:{line}')
+
+    for literal, found_at in locations.items():
+        if '\\(' in literal:
+            # interpolation should be handled via formatted keys
+            continue
+        if literal in keys:
+            continue
+        more = f' (+{len(found_at) - 1} more)' if len(found_at) > 1 else ''
+        errors.append(f'[swift] {found_at[0]} literal not in catalog: "{literal}"{more}')
 
     return errors
 
 
 def main() -> int:
+    data = load_catalog()
+    swift_files, cache_changed = collect_swift_literals()
     errors = []
-    errors.extend(check_catalog())
-    errors.extend(check_swift_literals())
+    errors.extend(check_catalog(data))
+    errors.extend(check_swift_literals(data, swift_files))
+    if cache_changed:
+        save_literal_cache(swift_files)
 
     if errors:
         print('\n'.join(errors))
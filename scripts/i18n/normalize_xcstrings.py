@@ -2,10 +2,28 @@
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 CATALOG = Path('chillnote/Resources/Localizable.xcstrings')
 REQUIRED_LOCALES = ['en', 'zh-Hans', 'zh-Hant', 'ja', 'fr', 'de', 'es', 'ko']
 
 
+def load_catalog() -> dict:
+    if orjson is not None:
+        return orjson.loads(CATALOG.read_bytes())
+    return json.loads(CATALOG.read_text(encoding='utf-8'))
+
+
+def write_catalog(data: dict) -> None:
+    if orjson is not None:
+        CATALOG.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    CATALOG.write_text(json.dumps(data, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+
+
 def fallback_value(key: str, localizations: dict) -> str:
     en_val = localizations.get('en', {}).get('stringUnit', {}).get('value')
     if isinstance(en_val, str) and en_val:
@@ -26,7 +44,7 @@ def ensure_unit(localizations: dict, locale: str, value: str) -> None:
 
 
 def main() -> None:
-    data = json.loads(CATALOG.read_text(encoding='utf-8'))
+    data = load_catalog()
     strings = data.get('strings', {})
 
     for key, value in strings.items():
@@ -41,7 +59,7 @@ def main() -> None:
             if isinstance(unit, dict) and unit.get('state') == 'new':
                 unit['state'] = 'translated'
 
-    CATALOG.write_text(json.dumps(data, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+    write_catalog(data)
     print(f'Normalized {len(strings)} keys in {CATALOG}')
 
 
@@ -0,0 +1,85 @@
+# Swift UI literal scanning and its per-file cache, shared by lint_i18n.py and
+# generate_reports.py (both run with scripts/i18n on sys.path).
+import bisect
+import json
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SWIFT_ROOT = Path('chillnote')
+
+# Scanned as bytes; each alternative captures its literal in its own named
+# group so the matched one is read straight off `match.lastgroup`. Bytes-mode
+# `\b` is ASCII-only, so non-ASCII identifier characters are excluded by hand.
+UI_LITERAL_PATTERN = re.compile(
+    rb'(?<![\w\x80-\xff])(?P<view>Text|Button|Label|TextField)\(\s*"(?P<view_literal>(?:\\.|[^"\\])*)"|'
+    rb'\.alert\(\s*"(?P<alert>(?:\\.|[^"\\])*)"|'
+    rb'\.navigationTitle\(\s*"(?P<navigation_title>(?:\\.|[^"\\])*)"|'
+    rb'\.accessibility(?:Label|Hint)\(\s*"(?P<accessibility>(?:\\.|[^"\\])*)"'
+)
+NEWLINE_PATTERN = re.compile(rb'\n')
+
+# Per-file literal cache. Bump the version whenever UI_LITERAL_PATTERN or the
+# cached row shape changes so stale entries are discarded.
+LITERAL_CACHE_PATH = Path('docs/i18n/.literal_cache.json')
+LITERAL_CACHE_VERSION = 1
+
+
+def read_swift_sources(paths: list[Path]) -> Iterator[tuple[Path, bytes]]:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield from zip(paths, executor.map(Path.read_bytes, paths))
+
+
+def scan_swift_literals(content: bytes) -> list[list]:
+    found: list[list] = []
+    newlines = [m.start() for m in NEWLINE_PATTERN.finditer(content)]
+    for match in UI_LITERAL_PATTERN.finditer(content):
+        literal = match.group(match.lastgroup).decode('utf-8')
+        if not literal:
+            continue
+        literal = literal.replace('\\n', '\n')
+        literal = literal.replace('\\"', '"')
+        line = bisect.bisect_left(newlines, match.start()) + 1
+        context = match.group('view').decode('utf-8') if match.group('view') else 'modifier'
+        found.append([literal, line, context])
+    return found
+
+
+def load_literal_cache() -> dict:
+    try:
+        cache = json.loads(LITERAL_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != LITERAL_CACHE_VERSION:
+        return {}
+    return cache.get('files', {})
+
+
+def save_literal_cache(files: dict) -> None:
+    LITERAL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    LITERAL_CACHE_PATH.write_text(
+        json.dumps({'version': LITERAL_CACHE_VERSION, 'files': files}, ensure_ascii=False),
+        encoding='utf-8',
+    )
+
+
+# Only files whose mtime or size changed since the cached run are re-read;
+# `changed` tells the caller whether the cache needs to be written back.
+def collect_swift_literals() -> tuple[dict, bool]:
+    cached = load_literal_cache()
+    files: dict = {}
+    stale: list[Path] = []
+    for path in SWIFT_ROOT.rglob('*.swift'):
+        stat = path.stat()
+        entry = cached.get(str(path))
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            files[str(path)] = entry
+            continue
+        files[str(path)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'literals': []}
+        stale.append(path)
+
+    for path, content in read_swift_sources(stale):
+        files[str(path)]['literals'] = scan_swift_literals(content)
+    changed = bool(stale) or files.keys() != cached.keys()
+    return files, changed